@@ -5,6 +5,7 @@ JSON schema expected by SKILL.md Pass 3B.
 
 Usage:
     python3 nd_cite_check.py --file opinion.md
+    python3 nd_cite_check.py --file a.md --file b.md --jobs 4
     echo "N.D.C.C. § 12.1-32-01" | python3 nd_cite_check.py
     echo "42 U.S.C. § 1983" | python3 nd_cite_check.py
 
@@ -12,7 +13,10 @@ Output: JSON array of citation records with local paths and URLs.
 """
 
 import argparse
+import concurrent.futures
+import functools
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -102,51 +106,62 @@ def _legacy_cite_type(c: Citation) -> str:
 # Search hint generation
 # ---------------------------------------------------------------------------
 
-def _search_hint(c: Citation, legacy_type: str) -> str:
-    """Build a search-friendly hint string."""
-    comp = c.components
+def _dotted(comp: dict, key: str) -> str:
+    """Format an NDCC number component with its decimal part, e.g. "12.1"."""
+    dec = comp.get(f"{key}_dec")
+    return f"{comp[key]}.{dec}" if dec else comp[key]
 
-    if legacy_type == "nd_case":
-        return f"{comp['year']}ND{comp['number']}"
 
-    if legacy_type == "ndcc":
-        t = f"{comp['title']}.{comp['title_dec']}" if comp.get("title_dec") else comp["title"]
-        ch = f"{comp['chapter']}.{comp['chapter_dec']}" if comp.get("chapter_dec") else comp["chapter"]
-        s = f"{comp['section']}.{comp['section_dec']}" if comp.get("section_dec") else comp["section"]
-        return f"{t}-{ch}-{s}"
+def _hint_ndcc(comp: dict) -> str:
+    return "-".join(
+        (_dotted(comp, "title"), _dotted(comp, "chapter"), _dotted(comp, "section"))
+    )
+
 
-    if legacy_type == "ndcc_chapter":
-        t = f"{comp['title']}.{comp['title_dec']}" if comp.get("title_dec") else comp["title"]
-        ch = f"{comp['chapter']}.{comp['chapter_dec']}" if comp.get("chapter_dec") else comp["chapter"]
-        return f"{t}-{ch}"
+_NDAC_PARTS = ("part1", "part2", "part3", "part4")
 
-    if legacy_type == "nd_const":
-        return f"art {comp['article']} sec {comp['section']}"
 
-    if legacy_type == "ndac":
-        parts = [comp.get(f"part{i}", "") for i in range(1, 5) if comp.get(f"part{i}")]
-        return "-".join(parts)
+def _hint_ndac(comp: dict) -> str:
+    return "-".join(filter(None, map(comp.get, _NDAC_PARTS)))
 
-    if legacy_type in ("usc", "cfr"):
-        label = "USC" if legacy_type == "usc" else "CFR"
-        return f"{comp['title']} {label} {comp['section']}"
 
-    if legacy_type == "us_supreme_court":
-        return f"{comp['volume']} US {comp['page']}"
+def _hint_us_const(comp: dict) -> str:
+    if "amendment" in comp:
+        return f"amendment {comp['amendment']}"
+    hint = f"article {comp['article']}"
+    if "section" in comp:
+        hint += f" section {comp['section']}"
+    return hint
 
-    if legacy_type in ("us_const_article", "us_const_amendment"):
-        if "amendment" in comp:
-            return f"amendment {comp['amendment']}"
-        hint = f"article {comp['article']}"
-        if "section" in comp:
-            hint += f" section {comp['section']}"
-        return hint
 
-    if legacy_type in ("state_case", "federal_reporter"):
-        return f"{comp.get('volume', '')} {comp.get('reporter', '')} {comp.get('page', '')}"
+def _hint_reporter(comp: dict) -> str:
+    return f"{comp.get('volume', '')} {comp.get('reporter', '')} {comp.get('page', '')}"
 
-    # Fallback: use normalized
-    return c.normalized
+
+# Legacy cite_type → hint builder over the citation's components
+_SEARCH_HINTS = {
+    "nd_case": lambda comp: f"{comp['year']}ND{comp['number']}",
+    "ndcc": _hint_ndcc,
+    "ndcc_chapter": lambda comp: f"{_dotted(comp, 'title')}-{_dotted(comp, 'chapter')}",
+    "nd_const": lambda comp: f"art {comp['article']} sec {comp['section']}",
+    "ndac": _hint_ndac,
+    "usc": lambda comp: f"{comp['title']} USC {comp['section']}",
+    "cfr": lambda comp: f"{comp['title']} CFR {comp['section']}",
+    "us_supreme_court": lambda comp: f"{comp['volume']} US {comp['page']}",
+    "us_const_article": _hint_us_const,
+    "us_const_amendment": _hint_us_const,
+    "state_case": _hint_reporter,
+    "federal_reporter": _hint_reporter,
+}
+
+
+def _search_hint(c: Citation, legacy_type: str) -> str:
+    """Build a search-friendly hint string."""
+    build = _SEARCH_HINTS.get(legacy_type)
+    if build is None:
+        # Fallback: use normalized
+        return c.normalized
+    return build(c.components)
 
 
 # ---------------------------------------------------------------------------
@@ -161,6 +176,34 @@ def _primary_url(c: Citation) -> str | None:
     return None
 
 
+# ---------------------------------------------------------------------------
+# Local file lookup
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def _dir_files(directory: Path) -> frozenset[str]:
+    """Names of regular files in directory (empty if it can't be listed).
+
+    Cached for the life of the process: citations cluster in a handful of
+    refs subdirectories, so one listing answers most lookups without a stat().
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(e.name for e in entries if e.is_file())
+    except OSError:
+        return frozenset()
+
+
+def _local_file_exists(path: Path) -> bool:
+    """Check path.is_file(), answering exact-name hits from a cached listing.
+
+    A miss falls back to path.is_file(), which honours case-insensitive
+    filesystems (macOS, Windows) and sees files added after the listing
+    was cached.
+    """
+    return path.name in _dir_files(path.parent) or path.is_file()
+
+
 # ---------------------------------------------------------------------------
 # Convert jetcite Citation → legacy dict
 # ---------------------------------------------------------------------------
@@ -183,7 +226,7 @@ def _to_legacy(c: Citation, refs_dir: Path) -> dict:
     if rel is not None:
         full = refs_dir / rel
         entry["local_path"] = str(full)
-        entry["local_exists"] = full.is_file()
+        entry["local_exists"] = _local_file_exists(full)
     else:
         entry["local_path"] = None
         entry["local_exists"] = False
@@ -223,7 +266,7 @@ def _add_parallel_info(entries: list[dict], citations: list[Citation]) -> None:
 # Public API
 # ---------------------------------------------------------------------------
 
-def scan_opinion(text: str, refs_dir: str = "~/refs") -> list[dict]:
+def scan_opinion(text: str, refs_dir: str | Path = "~/refs") -> list[dict]:
     """Scan opinion text for all citations. Returns legacy-format dicts."""
     refs = Path(refs_dir).expanduser()
     citations = scan_text(text, refs_dir=refs)
@@ -234,38 +277,69 @@ def scan_opinion(text: str, refs_dir: str = "~/refs") -> list[dict]:
     return entries
 
 
+def scan_file(path: Path, refs_dir: str | Path = "~/refs") -> list[dict]:
+    """Read a UTF-8 opinion file and scan it with scan_opinion()."""
+    return scan_opinion(path.read_text(encoding="utf-8"), refs_dir=refs_dir)
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
+def _scan_lines(lines, refs_dir: Path):
+    """Yield citation records for each non-blank line (stdin mode)."""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        yield from scan_opinion(line, refs_dir=refs_dir)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Parse legal citations, resolve local files, build URLs."
     )
-    parser.add_argument("--file", "-f", help="Scan a file for all citations")
+    parser.add_argument("--file", "-f", action="append",
+                        help="Scan a file for all citations (repeatable; "
+                             "results are concatenated in argument order)")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Scan multiple files in N worker processes (default: 1)")
     parser.add_argument("--refs-dir", default="~/refs",
                         help="Override refs directory (default: ~/refs)")
     parser.add_argument("--json", action="store_true", default=True,
                         help="Output as JSON (default)")
     args = parser.parse_args()
 
+    # Resolve once; stdin mode scans every line against the same directory
+    refs = Path(args.refs_dir).expanduser()
+
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
     if args.file:
-        path = Path(args.file).expanduser()
-        if not path.exists():
-            print(f"Error: file not found: {path}", file=sys.stderr)
-            sys.exit(1)
-        text = path.read_text(encoding="utf-8")
-        results = scan_opinion(text, refs_dir=args.refs_dir)
+        paths = [Path(f).expanduser() for f in args.file]
+        for path in paths:
+            if not path.exists():
+                print(f"Error: file not found: {path}", file=sys.stderr)
+                sys.exit(1)
+        if args.jobs > 1 and len(paths) > 1:
+            # Files are independent; scan them in separate processes
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(args.jobs, len(paths))
+            ) as executor:
+                per_file = list(
+                    executor.map(scan_file, paths, [refs] * len(paths))
+                )
+        else:
+            per_file = [scan_file(path, refs_dir=refs) for path in paths]
+        results = [entry for entries in per_file for entry in entries]
     else:
         # stdin mode — one citation per line
-        results = []
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
-                continue
-            found = scan_opinion(line, refs_dir=args.refs_dir)
-            results.extend(found)
+        results = list(_scan_lines(sys.stdin, refs))
 
+    # Nothing reaches stdout until every scan has succeeded, so a failure
+    # leaves it empty rather than holding a partial JSON array
     print(json.dumps(results, indent=2, ensure_ascii=False))
 
 
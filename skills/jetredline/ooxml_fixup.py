@@ -11,52 +11,146 @@ Usage:
 Outputs JSON summary to stdout.
 """
 
+import concurrent.futures
 import json
 import os
 import sys
 from pathlib import Path
 
-import defusedxml.minidom as minidom
+from lxml import etree
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+NS = {
+    "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "w14": "http://schemas.microsoft.com/office/word/2010/wordml",
+    "w15": "http://schemas.microsoft.com/office/word/2012/wordml",
+    "w16cid": "http://schemas.microsoft.com/office/word/2016/wordml/cid",
+    "w16cex": "http://schemas.microsoft.com/office/word/2018/wordml/cex",
+    "ct": "http://schemas.openxmlformats.org/package/2006/content-types",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+    "xml": "http://www.w3.org/XML/1998/namespace",
+}
+
+
+def qn(tag):
+    """Convert a prefixed name like "w:id" to lxml's {namespace}local form."""
+    prefix, local = tag.split(":")
+    return f"{{{NS[prefix]}}}{local}"
+
+# Precomputed {namespace}local names used inside per-element loops
+W_ID = qn("w:id")
+W_P = qn("w:p")
+W_PARA_ID = qn("w:paraId")
+W14_PARA_ID = qn("w14:paraId")
+W15_PARA_ID = qn("w15:paraId")
+W15_DURABLE_ID = qn("w15:durableId")
+W16CID_PARA_ID = qn("w16cid:paraId")
+W16CEX_DURABLE_ID = qn("w16cex:durableId")
+XML_SPACE = qn("xml:space")
+
+
 def parse_xml(path):
-    """Parse an XML file with defusedxml. Returns (doc, True) or (None, False)."""
+    """Parse an XML file without resolving entities or touching the network.
+
+    Returns (tree, True) or (None, False).
+    """
+    parser = etree.XMLParser(resolve_entities=False, no_network=True)
     try:
-        doc = minidom.parse(str(path))
-        return doc, True
+        tree = etree.parse(str(path), parser)
+        return tree, True
     except Exception:
         return None, False
 
 
-def write_xml(doc, path):
-    """Write a minidom document back to file, preserving XML declaration."""
-    xml_str = doc.toxml("utf-8")
-    Path(path).write_bytes(xml_str)
-
-
-def get_elements_by_tag(doc, tag):
-    """Get all elements matching a tag (handles namespaced tags)."""
-    return doc.getElementsByTagName(tag)
-
-
-def collect_w_ids(doc, tags):
-    """Collect all w:id values from given element tag names. Returns {id_int: [(tag, element)]}."""
-    id_map = {}
-    for tag in tags:
-        for el in get_elements_by_tag(doc, tag):
-            val = el.getAttribute("w:id")
-            if not val:
-                continue
-            try:
-                id_int = int(val)
-            except ValueError:
-                continue
-            id_map.setdefault(id_int, []).append((tag, el))
-    return id_map
+def write_xml(tree, path):
+    """Write an lxml tree back to file with a standalone XML declaration."""
+    tree.write(str(path), xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+class DocCache:
+    """Parse each part at most once and write back only the parts that changed.
+
+    Passes share trees through get(), call mark_dirty() after editing one,
+    and main() calls flush() once at the end.
+    """
+
+    def __init__(self):
+        self._trees = {}
+        self._dirty = set()
+
+    def get(self, path):
+        """Return (tree, True) for path, parsing it on first use, or (None, False)."""
+        path = Path(path)
+        if path not in self._trees:
+            self._trees[path], _ = parse_xml(path)
+        tree = self._trees[path]
+        return tree, tree is not None
+
+    def prefetch(self, paths):
+        """Parse several parts that are not cached yet, concurrently.
+
+        lxml releases the GIL while parsing from a file, so the parses
+        overlap. Missing files are skipped and left for get() to report.
+        """
+        pending = [Path(p) for p in paths if Path(p) not in self._trees and os.path.exists(p)]
+        if len(pending) < 2:
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            for path, (tree, _) in zip(pending, executor.map(parse_xml, pending)):
+                self._trees[path] = tree
+
+    def mark_dirty(self, path):
+        self._dirty.add(Path(path))
+
+    def flush(self):
+        """Write every dirty part back to disk."""
+        for path in self._dirty:
+            write_xml(self._trees[path], path)
+        self._dirty.clear()
+
+
+def find_rels_files(unpacked_dir):
+    """Return every .rels file in the package, sorted by path.
+
+    Relationship parts live in _rels directories, so only those directories
+    are listed for files; elsewhere the walk just descends into subdirectories.
+    """
+    rels_files = []
+    pending = [os.fspath(unpacked_dir)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name != "_rels":
+                    pending.append(entry.path)
+                    continue
+                with os.scandir(entry.path) as rels_entries:
+                    rels_files.extend(
+                        Path(rels.path) for rels in rels_entries
+                        if rels.name.endswith(".rels") and rels.is_file()
+                    )
+    return sorted(rels_files)
+
+
+def get_elements_by_tag(tree, tag):
+    """Get all elements matching a prefixed tag name, e.g. "w:ins"."""
+    return tree.iter(qn(tag))
+
+
+def remove_elements(elements):
+    """Detach each element from its parent. Returns how many were removed.
+
+    Callers collect only the elements to drop while iterating, since lxml
+    iterators must not see the tree change underneath them.
+    """
+    for el in elements:
+        el.getparent().remove(el)
+    return len(elements)
 
 
 # ---------------------------------------------------------------------------
@@ -68,50 +162,78 @@ COMMENT_DOC_TAGS = ["w:commentRangeStart", "w:commentRangeEnd", "w:commentRefere
 CHANGE_TAGS = ["w:ins", "w:del", "w:rPrChange", "w:pPrChange", "w:sectPrChange",
                "w:tblPrChange", "w:trPrChange", "w:tcPrChange", "w:tblGridChange"]
 
+# Clark name -> annotation category
+ANNOTATION_CATEGORIES = {
+    qn(tag): category
+    for category, tags in (("bookmark", BOOKMARK_TAGS),
+                           ("comment", COMMENT_DOC_TAGS),
+                           ("change", CHANGE_TAGS))
+    for tag in tags
+}
+RENUMBERABLE_TAGS = tuple(qn(tag) for tag in COMMENT_DOC_TAGS + CHANGE_TAGS)
+
+
+def parse_w_id(el):
+    """Return an element's w:id as an int, or None if missing or not numeric."""
+    val = el.get(W_ID)
+    if not val:
+        return None
+    try:
+        return int(val)
+    except ValueError:
+        return None
+
 
-def deconflict_ids(unpacked_dir):
+def collect_w_ids(tree):
+    """Collect w:id values for bookmarks, comment markers, and tracked changes
+    in a single pass over the tree.
+
+    Returns {category: set_of_ids} for "bookmark", "comment", and "change".
+    """
+    id_sets = {"bookmark": set(), "comment": set(), "change": set()}
+    for el in tree.iter(*ANNOTATION_CATEGORIES):
+        id_int = parse_w_id(el)
+        if id_int is not None:
+            id_sets[ANNOTATION_CATEGORIES[el.tag]].add(id_int)
+    return id_sets
+
+
+def deconflict_ids(unpacked_dir, cache):
     """Renumber comment and tracked-change IDs to avoid collisions with bookmarks."""
     summary = {"comments_renumbered": 0, "changes_renumbered": 0}
 
     doc_path = unpacked_dir / "word" / "document.xml"
     comments_path = unpacked_dir / "word" / "comments.xml"
 
-    doc, ok = parse_xml(doc_path)
+    doc, ok = cache.get(doc_path)
     if not ok:
         return summary
 
     # Collect ALL w:id values across annotation types in document.xml
-    all_tags = BOOKMARK_TAGS + COMMENT_DOC_TAGS + CHANGE_TAGS
-    all_ids = collect_w_ids(doc, all_tags)
-    bookmark_ids = collect_w_ids(doc, BOOKMARK_TAGS)
-    comment_doc_ids = collect_w_ids(doc, COMMENT_DOC_TAGS)
-    change_ids = collect_w_ids(doc, CHANGE_TAGS)
-
-    # Find the max ID across all annotation types
-    all_id_values = set(all_ids.keys())
-    if not all_id_values:
-        return summary
-
-    max_id = max(all_id_values)
-
-    # Check if there are actual collisions; if not, skip
-    bookmark_id_set = set(bookmark_ids.keys())
-    comment_id_set = set(comment_doc_ids.keys())
-    change_id_set = set(change_ids.keys())
-
-    has_collision = bool(
-        (bookmark_id_set & comment_id_set) or
-        (bookmark_id_set & change_id_set) or
-        (comment_id_set & change_id_set)
+    id_sets = collect_w_ids(doc)
+
+    # Check if there are actual collisions; if not, skip before touching
+    # comments.xml or serializing anything
+    bookmark_id_set = id_sets["bookmark"]
+    comment_id_set = id_sets["comment"]
+    change_id_set = id_sets["change"]
+
+    has_collision = not (
+        bookmark_id_set.isdisjoint(comment_id_set) and
+        bookmark_id_set.isdisjoint(change_id_set) and
+        comment_id_set.isdisjoint(change_id_set)
     )
 
     if not has_collision:
         return summary
 
+    # Find the max ID across all annotation types
+    max_id = max(max(ids) for ids in (bookmark_id_set, comment_id_set, change_id_set) if ids)
+
     # Parse comments.xml for consistent renumbering
     comments_doc = None
     if comments_path.exists():
-        comments_doc, _ = parse_xml(comments_path)
+        comments_doc, _ = cache.get(comments_path)
 
     # Build old→new mapping for comments
     next_id = max_id + 1
@@ -121,25 +243,12 @@ def deconflict_ids(unpacked_dir):
             comment_id_remap[old_id] = next_id
             next_id += 1
 
-    # Renumber comments in document.xml
-    for old_id, new_id in comment_id_remap.items():
-        if old_id in comment_doc_ids:
-            for tag, el in comment_doc_ids[old_id]:
-                el.setAttribute("w:id", str(new_id))
-                summary["comments_renumbered"] += 1
-
     # Renumber comments in comments.xml
     if comments_doc and comment_id_remap:
         for comment_el in get_elements_by_tag(comments_doc, "w:comment"):
-            val = comment_el.getAttribute("w:id")
-            if not val:
-                continue
-            try:
-                old_id = int(val)
-            except ValueError:
-                continue
+            old_id = parse_w_id(comment_el)
             if old_id in comment_id_remap:
-                comment_el.setAttribute("w:id", str(comment_id_remap[old_id]))
+                comment_el.set(W_ID, str(comment_id_remap[old_id]))
 
     # Build old→new mapping for tracked changes
     change_id_remap = {}
@@ -148,17 +257,22 @@ def deconflict_ids(unpacked_dir):
             change_id_remap[old_id] = next_id
             next_id += 1
 
-    # Renumber tracked changes in document.xml
-    for old_id, new_id in change_id_remap.items():
-        if old_id in change_ids:
-            for tag, el in change_ids[old_id]:
-                el.setAttribute("w:id", str(new_id))
-                summary["changes_renumbered"] += 1
+    # Renumber comments and tracked changes in document.xml in one walk
+    remaps = {
+        "comment": (comment_id_remap, "comments_renumbered"),
+        "change": (change_id_remap, "changes_renumbered"),
+    }
+    for el in doc.iter(*RENUMBERABLE_TAGS):
+        id_remap, counter = remaps[ANNOTATION_CATEGORIES[el.tag]]
+        old_id = parse_w_id(el)
+        if old_id in id_remap:
+            el.set(W_ID, str(id_remap[old_id]))
+            summary[counter] += 1
 
     # Write back
-    write_xml(doc, doc_path)
+    cache.mark_dirty(doc_path)
     if comments_doc and comment_id_remap:
-        write_xml(comments_doc, comments_path)
+        cache.mark_dirty(comments_path)
 
     return summary
 
@@ -168,7 +282,11 @@ def deconflict_ids(unpacked_dir):
 # ---------------------------------------------------------------------------
 
 def dedup_relationships(unpacked_dir):
-    """Remove duplicate entries from [Content_Types].xml and all .rels files."""
+    """Remove duplicate entries from [Content_Types].xml and all .rels files.
+
+    No other pass reads these parts, so each one is parsed, fixed, and
+    written on its own rather than held in the DocCache until the end.
+    """
     summary = {"content_types_removed": 0, "rels_removed": 0}
 
     # [Content_Types].xml
@@ -176,42 +294,41 @@ def dedup_relationships(unpacked_dir):
     if ct_path.exists():
         doc, ok = parse_xml(ct_path)
         if ok:
-            root = doc.documentElement
+            duplicates = []
             # Dedup Override by PartName
             seen = set()
-            for el in list(get_elements_by_tag(doc, "Override")):
-                key = el.getAttribute("PartName")
+            for el in get_elements_by_tag(doc, "ct:Override"):
+                key = el.get("PartName", "")
                 if key in seen:
-                    el.parentNode.removeChild(el)
-                    summary["content_types_removed"] += 1
+                    duplicates.append(el)
                 else:
                     seen.add(key)
             # Dedup Default by Extension
             seen = set()
-            for el in list(get_elements_by_tag(doc, "Default")):
-                key = el.getAttribute("Extension")
+            for el in get_elements_by_tag(doc, "ct:Default"):
+                key = el.get("Extension", "")
                 if key in seen:
-                    el.parentNode.removeChild(el)
-                    summary["content_types_removed"] += 1
+                    duplicates.append(el)
                 else:
                     seen.add(key)
+            summary["content_types_removed"] += remove_elements(duplicates)
             if summary["content_types_removed"] > 0:
                 write_xml(doc, ct_path)
 
     # All .rels files
-    for rels_path in unpacked_dir.rglob("*.rels"):
+    for rels_path in find_rels_files(unpacked_dir):
         doc, ok = parse_xml(rels_path)
         if not ok:
             continue
         seen = set()
-        removed = 0
-        for el in list(get_elements_by_tag(doc, "Relationship")):
-            key = (el.getAttribute("Type"), el.getAttribute("Target"))
+        duplicates = []
+        for el in get_elements_by_tag(doc, "rel:Relationship"):
+            key = (el.get("Type", ""), el.get("Target", ""))
             if key in seen:
-                el.parentNode.removeChild(el)
-                removed += 1
+                duplicates.append(el)
             else:
                 seen.add(key)
+        removed = remove_elements(duplicates)
         if removed > 0:
             write_xml(doc, rels_path)
             summary["rels_removed"] += removed
@@ -223,7 +340,7 @@ def dedup_relationships(unpacked_dir):
 # C. Clean orphaned comment artifacts
 # ---------------------------------------------------------------------------
 
-def clean_orphaned_comments(unpacked_dir):
+def clean_orphaned_comments(unpacked_dir, cache):
     """Remove entries from commentsExtended/commentsIds/commentsExtensible
     that don't correspond to actual w:comment entries in comments.xml."""
     summary = {"orphans_removed": 0}
@@ -232,7 +349,22 @@ def clean_orphaned_comments(unpacked_dir):
     if not comments_path.exists():
         return summary
 
-    comments_doc, ok = parse_xml(comments_path)
+    ext_path = unpacked_dir / "word" / "commentsExtended.xml"
+    ids_path = unpacked_dir / "word" / "commentsIds.xml"
+    extensible_path = unpacked_dir / "word" / "commentsExtensible.xml"
+    # Only commentsExtended and commentsIds entries are judged against
+    # comments.xml (commentsExtensible hangs off commentsExtended), so
+    # without either there is nothing to clean and no reason to parse
+    if not (ext_path.exists() or ids_path.exists()):
+        return summary
+    # commentsExtensible is only read when commentsExtended supplies durable
+    # IDs, so it is not worth parsing ahead of time without that part
+    prefetch = [comments_path, ext_path, ids_path]
+    if ext_path.exists():
+        prefetch.append(extensible_path)
+    cache.prefetch(prefetch)
+
+    comments_doc, ok = cache.get(comments_path)
     if not ok:
         return summary
 
@@ -240,68 +372,60 @@ def clean_orphaned_comments(unpacked_dir):
     valid_para_ids = set()
     for comment_el in get_elements_by_tag(comments_doc, "w:comment"):
         # Each w:comment may contain paragraphs with w14:paraId
-        for p_el in comment_el.getElementsByTagName("w:p"):
-            para_id = (p_el.getAttribute("w14:paraId") or
-                       p_el.getAttribute("w:paraId"))
+        for p_el in comment_el.iter(W_P):
+            para_id = (p_el.get(W14_PARA_ID) or
+                       p_el.get(W_PARA_ID))
             if para_id:
                 valid_para_ids.add(para_id)
 
-    # Also collect comment IDs for commentsExtensible (uses durableId linkage)
-    valid_comment_ids = set()
-    for comment_el in get_elements_by_tag(comments_doc, "w:comment"):
-        cid = comment_el.getAttribute("w:id")
-        if cid:
-            valid_comment_ids.add(cid)
-
     # Process commentsExtended.xml
-    ext_path = unpacked_dir / "word" / "commentsExtended.xml"
     durable_ids_from_valid = set()
     if ext_path.exists():
-        ext_doc, ok = parse_xml(ext_path)
+        ext_doc, ok = cache.get(ext_path)
         if ok:
-            removed = 0
-            for el in list(get_elements_by_tag(ext_doc, "w15:commentEx")):
-                para_id = el.getAttribute("w15:paraId")
+            orphans = []
+            for el in get_elements_by_tag(ext_doc, "w15:commentEx"):
+                para_id = el.get(W15_PARA_ID)
                 if para_id and para_id not in valid_para_ids:
-                    el.parentNode.removeChild(el)
-                    removed += 1
+                    orphans.append(el)
                 elif para_id and para_id in valid_para_ids:
                     # Track durable IDs that correspond to valid comments
-                    did = el.getAttribute("w15:durableId")
+                    did = el.get(W15_DURABLE_ID)
                     if did:
                         durable_ids_from_valid.add(did)
+            removed = remove_elements(orphans)
             if removed > 0:
-                write_xml(ext_doc, ext_path)
+                cache.mark_dirty(ext_path)
                 summary["orphans_removed"] += removed
 
     # Process commentsIds.xml
-    ids_path = unpacked_dir / "word" / "commentsIds.xml"
     if ids_path.exists():
-        ids_doc, ok = parse_xml(ids_path)
+        ids_doc, ok = cache.get(ids_path)
         if ok:
-            removed = 0
-            for el in list(get_elements_by_tag(ids_doc, "w16cid:commentId")):
-                para_id = el.getAttribute("w16cid:paraId")
+            orphans = []
+            for el in get_elements_by_tag(ids_doc, "w16cid:commentId"):
+                para_id = el.get(W16CID_PARA_ID)
                 if para_id and para_id not in valid_para_ids:
-                    el.parentNode.removeChild(el)
-                    removed += 1
+                    orphans.append(el)
+            removed = remove_elements(orphans)
             if removed > 0:
-                write_xml(ids_doc, ids_path)
+                cache.mark_dirty(ids_path)
                 summary["orphans_removed"] += removed
 
-    # Process commentsExtensible.xml (keyed by durableId)
-    extensible_path = unpacked_dir / "word" / "commentsExtensible.xml"
-    if extensible_path.exists():
-        ext_doc, ok = parse_xml(extensible_path)
+    # Process commentsExtensible.xml (keyed by durableId). Without durable IDs
+    # from commentsExtended there is nothing to judge entries against, so
+    # the part is not even used.
+    if durable_ids_from_valid and extensible_path.exists():
+        ext_doc, ok = cache.get(extensible_path)
         if ok:
-            removed = 0
-            for el in list(get_elements_by_tag(ext_doc, "w16cex:commentExtensible")):
-                durable_id = el.getAttribute("w16cex:durableId")
-                if durable_id and durable_ids_from_valid and durable_id not in durable_ids_from_valid:
-                    el.parentNode.removeChild(el)
-                    removed += 1
+            orphans = []
+            for el in get_elements_by_tag(ext_doc, "w16cex:commentExtensible"):
+                durable_id = el.get(W16CEX_DURABLE_ID)
+                if durable_id and durable_id not in durable_ids_from_valid:
+                    orphans.append(el)
+            removed = remove_elements(orphans)
             if removed > 0:
-                write_xml(ext_doc, extensible_path)
+                cache.mark_dirty(extensible_path)
                 summary["orphans_removed"] += removed
 
     return summary
@@ -311,33 +435,26 @@ def clean_orphaned_comments(unpacked_dir):
 # D. Fix xml:space="preserve"
 # ---------------------------------------------------------------------------
 
-def fix_xml_space(unpacked_dir):
+def fix_xml_space(unpacked_dir, cache):
     """Add xml:space='preserve' to w:t elements with leading/trailing whitespace."""
     summary = {"space_attrs_added": 0}
 
     doc_path = unpacked_dir / "word" / "document.xml"
-    doc, ok = parse_xml(doc_path)
+    doc, ok = cache.get(doc_path)
     if not ok:
         return summary
 
     modified = False
     for wt in get_elements_by_tag(doc, "w:t"):
-        # Get text content
-        text = ""
-        for child in wt.childNodes:
-            if child.nodeType == child.TEXT_NODE:
-                text += child.data
-        if not text:
-            continue
-        if text != text.strip():
-            # Has leading/trailing whitespace
-            if not wt.getAttribute("xml:space"):
-                wt.setAttribute("xml:space", "preserve")
-                summary["space_attrs_added"] += 1
-                modified = True
+        text = wt.text
+        if text and text != text.strip() and not wt.get(XML_SPACE):
+            # Leading/trailing whitespace that Word would otherwise collapse
+            wt.set(XML_SPACE, "preserve")
+            summary["space_attrs_added"] += 1
+            modified = True
 
     if modified:
-        write_xml(doc, doc_path)
+        cache.mark_dirty(doc_path)
 
     return summary
 
@@ -356,11 +473,13 @@ def main():
         print(f"Error: {unpacked_dir} is not a directory", file=sys.stderr)
         sys.exit(1)
 
+    cache = DocCache()
     results = {}
-    results["id_deconfliction"] = deconflict_ids(unpacked_dir)
+    results["id_deconfliction"] = deconflict_ids(unpacked_dir, cache)
     results["relationship_dedup"] = dedup_relationships(unpacked_dir)
-    results["orphan_cleanup"] = clean_orphaned_comments(unpacked_dir)
-    results["xml_space_fix"] = fix_xml_space(unpacked_dir)
+    results["orphan_cleanup"] = clean_orphaned_comments(unpacked_dir, cache)
+    results["xml_space_fix"] = fix_xml_space(unpacked_dir, cache)
+    cache.flush()
 
     # Compute total changes
     total = sum(
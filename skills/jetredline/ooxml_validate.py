@@ -10,76 +10,212 @@ Usage:
 Exits 0 if clean. Exits 1 with diagnostic JSON on stdout if issues found.
 """
 
+import concurrent.futures
 import json
+import os
 import sys
 from pathlib import Path
 
-import defusedxml.minidom as minidom
+from lxml import etree
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+NS = {
+    "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+    "w14": "http://schemas.microsoft.com/office/word/2010/wordml",
+    "w15": "http://schemas.microsoft.com/office/word/2012/wordml",
+    "w16cid": "http://schemas.microsoft.com/office/word/2016/wordml/cid",
+    "w16cex": "http://schemas.microsoft.com/office/word/2018/wordml/cex",
+    "ct": "http://schemas.openxmlformats.org/package/2006/content-types",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+    "xml": "http://www.w3.org/XML/1998/namespace",
+}
+
+
+def qn(tag):
+    """Convert a prefixed name like "w:id" to lxml's {namespace}local form."""
+    prefix, local = tag.split(":")
+    return f"{{{NS[prefix]}}}{local}"
+
+# Precomputed {namespace}local names used inside per-element loops
+W_ID = qn("w:id")
+W_P = qn("w:p")
+W_PARA_ID = qn("w:paraId")
+W14_PARA_ID = qn("w14:paraId")
+W15_PARA_ID = qn("w15:paraId")
+W16CID_PARA_ID = qn("w16cid:paraId")
+XML_SPACE = qn("xml:space")
+
+
 def parse_xml(path):
-    """Parse an XML file with defusedxml. Returns (doc, True) or (None, False)."""
+    """Parse an XML file without resolving entities or touching the network.
+
+    Returns (tree, True) or (None, False).
+    """
+    parser = etree.XMLParser(resolve_entities=False, no_network=True)
     try:
-        doc = minidom.parse(str(path))
-        return doc, True
+        tree = etree.parse(str(path), parser)
+        return tree, True
     except Exception:
         return None, False
 
 
-def get_elements_by_tag(doc, tag):
-    return doc.getElementsByTagName(tag)
+def parse_parts(paths):
+    """Parse several XML files concurrently. Returns [(tree, ok), ...] in order.
+
+    lxml releases the GIL while parsing from a file, so the parses overlap.
+    Missing files come back as (None, False) without being opened.
+    """
+    existing = [path for path in paths if path.exists()]
+    if len(existing) < 2:
+        parsed = dict(zip(existing, map(parse_xml, existing)))
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(existing)) as executor:
+            parsed = dict(zip(existing, executor.map(parse_xml, existing)))
+    return [parsed.get(path, (None, False)) for path in paths]
+
+
+def find_rels_files(unpacked_dir):
+    """Return every .rels file in the package, sorted by path.
+
+    Relationship parts live in _rels directories, so only those directories
+    are listed for files; elsewhere the walk just descends into subdirectories.
+    """
+    rels_files = []
+    pending = [os.fspath(unpacked_dir)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name != "_rels":
+                    pending.append(entry.path)
+                    continue
+                with os.scandir(entry.path) as rels_entries:
+                    rels_files.extend(
+                        Path(rels.path) for rels in rels_entries
+                        if rels.name.endswith(".rels") and rels.is_file()
+                    )
+    return sorted(rels_files)
+
+
+def get_elements_by_tag(tree, tag):
+    return tree.iter(qn(tag))
+
+
+def iterparse_elements(path, tags):
+    """Stream (tag, element) for elements matching the given prefixed tags.
+
+    Finished paragraphs are discarded as the parse advances, so memory stays
+    flat on large parts. Raises on unreadable or malformed XML.
+    """
+    tag_names = {qn(tag): tag for tag in tags}
+    context = etree.iterparse(str(path), events=("end",), tag=[*tag_names, W_P],
+                              resolve_entities=False, no_network=True)
+    for _, el in context:
+        tag = tag_names.get(el.tag)
+        if tag is not None:
+            yield tag, el
+        if el.tag == W_P:
+            el.clear(keep_tail=True)
+            parent = el.getparent()
+            if parent is not None:
+                while el.getprevious() is not None:
+                    del parent[0]
 
 
 # ---------------------------------------------------------------------------
-# Check 1: Unique w:id values across annotation types
+# document.xml scan (shared by checks 1, 2, and 5)
 # ---------------------------------------------------------------------------
 
-ANNOTATION_TAGS = [
-    "w:bookmarkStart", "w:bookmarkEnd",
-    "w:commentRangeStart", "w:commentRangeEnd", "w:commentReference",
-    "w:ins", "w:del", "w:rPrChange", "w:pPrChange", "w:sectPrChange",
-    "w:tblPrChange", "w:trPrChange", "w:tcPrChange", "w:tblGridChange",
-]
+BOOKMARK_TAGS = ["w:bookmarkStart", "w:bookmarkEnd"]
+COMMENT_DOC_TAGS = ["w:commentRangeStart", "w:commentRangeEnd", "w:commentReference"]
+CHANGE_TAGS = ["w:ins", "w:del", "w:rPrChange", "w:pPrChange", "w:sectPrChange",
+               "w:tblPrChange", "w:trPrChange", "w:tcPrChange", "w:tblGridChange"]
+ANNOTATION_TAGS = BOOKMARK_TAGS + COMMENT_DOC_TAGS + CHANGE_TAGS
 
+# Tag -> annotation category, and tag -> position for stable reporting
+TAG_CATEGORY = {
+    **{tag: "bookmark" for tag in BOOKMARK_TAGS},
+    **{tag: "comment" for tag in COMMENT_DOC_TAGS},
+    **{tag: "change" for tag in CHANGE_TAGS},
+}
+TAG_ORDER = {tag: i for i, tag in enumerate(ANNOTATION_TAGS)}
 
-def check_unique_ids(unpacked_dir):
-    """Check that all w:id values are unique across annotation types."""
-    issues = []
+
+def scan_document(unpacked_dir):
+    """Collect everything the document.xml checks need in one streaming pass.
+
+    A missing or malformed document.xml yields an empty scan, so those
+    checks report nothing.
+    """
     doc_path = unpacked_dir / "word" / "document.xml"
-    doc, ok = parse_xml(doc_path)
-    if not ok:
-        return issues
+    scan = {
+        "ids": {},  # id_value -> list of tags
+        "shared_ids": {},  # id_value -> first-seen order, for cross-category ids
+        "comment_starts": set(),
+        "comment_ends": set(),
+        "comment_refs": set(),
+        "space_previews": [],  # w:t text with edge whitespace, no xml:space
+    }
+    comment_sets = {
+        "w:commentRangeStart": scan["comment_starts"],
+        "w:commentRangeEnd": scan["comment_ends"],
+        "w:commentReference": scan["comment_refs"],
+    }
+    first_seen = {}  # id_value -> (category of first tag, order)
 
-    seen = {}  # id_value -> list of tags
-    for tag in ANNOTATION_TAGS:
-        for el in get_elements_by_tag(doc, tag):
-            val = el.getAttribute("w:id")
+    try:
+        for tag, el in iterparse_elements(doc_path, ANNOTATION_TAGS + ["w:t"]):
+            if tag == "w:t":
+                text = el.text
+                if text and text != text.strip() and not el.get(XML_SPACE):
+                    scan["space_previews"].append(text[:30].replace("\n", "\\n"))
+                continue
+            val = el.get(W_ID)
             if not val:
                 continue
-            seen.setdefault(val, []).append(tag)
-
-    for id_val, tags in seen.items():
-        if len(tags) > 1:
-            # Filter: bookmarkStart+bookmarkEnd sharing an ID is normal
-            unique_types = set()
-            for t in tags:
-                if t in ("w:bookmarkStart", "w:bookmarkEnd"):
-                    unique_types.add("bookmark")
-                elif t in ("w:commentRangeStart", "w:commentRangeEnd", "w:commentReference"):
-                    unique_types.add("comment")
-                else:
-                    unique_types.add("change")
-            if len(unique_types) > 1:
-                issues.append({
-                    "check": "unique_ids",
-                    "id": id_val,
-                    "tags": tags,
-                    "message": f"ID {id_val} shared across annotation types: {', '.join(tags)}"
-                })
+            category = TAG_CATEGORY[tag]
+            if val in first_seen:
+                scan["ids"][val].append(tag)
+                # bookmarkStart+bookmarkEnd sharing an ID is normal; a second
+                # category is not
+                first_category, order = first_seen[val]
+                if category != first_category:
+                    scan["shared_ids"][val] = order
+            else:
+                scan["ids"][val] = [tag]
+                first_seen[val] = (category, len(first_seen))
+            if tag in comment_sets:
+                comment_sets[tag].add(val)
+    except Exception:
+        for collected in scan.values():
+            collected.clear()
+
+    return scan
+
+
+# ---------------------------------------------------------------------------
+# Check 1: Unique w:id values across annotation types
+# ---------------------------------------------------------------------------
+
+def check_unique_ids(scan):
+    """Check that all w:id values are unique across annotation types."""
+    issues = []
+
+    shared_ids = scan["shared_ids"]
+    for id_val in sorted(shared_ids, key=shared_ids.__getitem__):
+        # Report tags in ANNOTATION_TAGS order rather than document order
+        tags = sorted(scan["ids"][id_val], key=TAG_ORDER.__getitem__)
+        issues.append({
+            "check": "unique_ids",
+            "id": id_val,
+            "tags": tags,
+            "message": f"ID {id_val} shared across annotation types: {', '.join(tags)}"
+        })
 
     return issues
 
@@ -88,30 +224,12 @@ def check_unique_ids(unpacked_dir):
 # Check 2: Comment range/reference consistency
 # ---------------------------------------------------------------------------
 
-def check_comment_consistency(unpacked_dir):
+def check_comment_consistency(scan):
     """Check that every commentRangeStart has matching End and Reference."""
     issues = []
-    doc_path = unpacked_dir / "word" / "document.xml"
-    doc, ok = parse_xml(doc_path)
-    if not ok:
-        return issues
-
-    starts = set()
-    ends = set()
-    refs = set()
-
-    for el in get_elements_by_tag(doc, "w:commentRangeStart"):
-        val = el.getAttribute("w:id")
-        if val:
-            starts.add(val)
-    for el in get_elements_by_tag(doc, "w:commentRangeEnd"):
-        val = el.getAttribute("w:id")
-        if val:
-            ends.add(val)
-    for el in get_elements_by_tag(doc, "w:commentReference"):
-        val = el.getAttribute("w:id")
-        if val:
-            refs.add(val)
+    starts = scan["comment_starts"]
+    ends = scan["comment_ends"]
+    refs = scan["comment_refs"]
 
     for cid in starts - ends:
         issues.append({
@@ -154,40 +272,42 @@ def check_comment_artifacts(unpacked_dir):
     if not comments_path.exists():
         return issues
 
-    comments_doc, ok = parse_xml(comments_path)
+    ext_path = unpacked_dir / "word" / "commentsExtended.xml"
+    ids_path = unpacked_dir / "word" / "commentsIds.xml"
+    # Every check below compares comments.xml against one of these parts
+    if not (ext_path.exists() or ids_path.exists()):
+        return issues
+    (comments_doc, ok), ext_parsed, ids_parsed = parse_parts(
+        [comments_path, ext_path, ids_path])
     if not ok:
         return issues
 
     # Collect paraIds from comments.xml
     comment_para_ids = set()
     for comment_el in get_elements_by_tag(comments_doc, "w:comment"):
-        for p_el in comment_el.getElementsByTagName("w:p"):
-            para_id = (p_el.getAttribute("w14:paraId") or
-                       p_el.getAttribute("w:paraId"))
+        for p_el in comment_el.iter(W_P):
+            para_id = (p_el.get(W14_PARA_ID) or
+                       p_el.get(W_PARA_ID))
             if para_id:
                 comment_para_ids.add(para_id)
 
     # commentsExtended.xml
-    ext_path = unpacked_dir / "word" / "commentsExtended.xml"
     ext_para_ids = set()
-    if ext_path.exists():
-        ext_doc, ok = parse_xml(ext_path)
-        if ok:
-            for el in get_elements_by_tag(ext_doc, "w15:commentEx"):
-                para_id = el.getAttribute("w15:paraId")
-                if para_id:
-                    ext_para_ids.add(para_id)
+    ext_doc, ok = ext_parsed
+    if ok:
+        for el in get_elements_by_tag(ext_doc, "w15:commentEx"):
+            para_id = el.get(W15_PARA_ID)
+            if para_id:
+                ext_para_ids.add(para_id)
 
     # commentsIds.xml
-    ids_path = unpacked_dir / "word" / "commentsIds.xml"
     ids_para_ids = set()
-    if ids_path.exists():
-        ids_doc, ok = parse_xml(ids_path)
-        if ok:
-            for el in get_elements_by_tag(ids_doc, "w16cid:commentId"):
-                para_id = el.getAttribute("w16cid:paraId")
-                if para_id:
-                    ids_para_ids.add(para_id)
+    ids_doc, ok = ids_parsed
+    if ok:
+        for el in get_elements_by_tag(ids_doc, "w16cid:commentId"):
+            para_id = el.get(W16CID_PARA_ID)
+            if para_id:
+                ids_para_ids.add(para_id)
 
     # Check for orphans in extended
     for pid in ext_para_ids - comment_para_ids:
@@ -240,8 +360,8 @@ def check_duplicate_entries(unpacked_dir):
         doc, ok = parse_xml(ct_path)
         if ok:
             seen = set()
-            for el in get_elements_by_tag(doc, "Override"):
-                key = el.getAttribute("PartName")
+            for el in get_elements_by_tag(doc, "ct:Override"):
+                key = el.get("PartName", "")
                 if key in seen:
                     issues.append({
                         "check": "duplicate_entries",
@@ -251,8 +371,8 @@ def check_duplicate_entries(unpacked_dir):
                 else:
                     seen.add(key)
             seen = set()
-            for el in get_elements_by_tag(doc, "Default"):
-                key = el.getAttribute("Extension")
+            for el in get_elements_by_tag(doc, "ct:Default"):
+                key = el.get("Extension", "")
                 if key in seen:
                     issues.append({
                         "check": "duplicate_entries",
@@ -263,14 +383,14 @@ def check_duplicate_entries(unpacked_dir):
                     seen.add(key)
 
     # .rels files
-    for rels_path in unpacked_dir.rglob("*.rels"):
+    for rels_path in find_rels_files(unpacked_dir):
         doc, ok = parse_xml(rels_path)
         if not ok:
             continue
         seen = set()
         rel_name = str(rels_path.relative_to(unpacked_dir))
-        for el in get_elements_by_tag(doc, "Relationship"):
-            key = (el.getAttribute("Type"), el.getAttribute("Target"))
+        for el in get_elements_by_tag(doc, "rel:Relationship"):
+            key = (el.get("Type", ""), el.get("Target", ""))
             if key in seen:
                 issues.append({
                     "check": "duplicate_entries",
@@ -287,30 +407,16 @@ def check_duplicate_entries(unpacked_dir):
 # Check 5: xml:space="preserve" on w:t with whitespace
 # ---------------------------------------------------------------------------
 
-def check_xml_space(unpacked_dir):
+def check_xml_space(scan):
     """Check that w:t elements with leading/trailing whitespace have xml:space='preserve'."""
     issues = []
-    doc_path = unpacked_dir / "word" / "document.xml"
-    doc, ok = parse_xml(doc_path)
-    if not ok:
-        return issues
 
-    for wt in get_elements_by_tag(doc, "w:t"):
-        text = ""
-        for child in wt.childNodes:
-            if child.nodeType == child.TEXT_NODE:
-                text += child.data
-        if not text:
-            continue
-        if text != text.strip():
-            if not wt.getAttribute("xml:space"):
-                # Try to give useful context
-                preview = text[:30].replace("\n", "\\n")
-                issues.append({
-                    "check": "xml_space",
-                    "text_preview": preview,
-                    "message": f"w:t with whitespace missing xml:space=\"preserve\": \"{preview}...\""
-                })
+    for preview in scan["space_previews"]:
+        issues.append({
+            "check": "xml_space",
+            "text_preview": preview,
+            "message": f"w:t with whitespace missing xml:space=\"preserve\": \"{preview}...\""
+        })
 
     return issues
 
@@ -329,12 +435,14 @@ def main():
         print(f"Error: {unpacked_dir} is not a directory", file=sys.stderr)
         sys.exit(1)
 
+    scan = scan_document(unpacked_dir)
+
     all_issues = []
-    all_issues.extend(check_unique_ids(unpacked_dir))
-    all_issues.extend(check_comment_consistency(unpacked_dir))
+    all_issues.extend(check_unique_ids(scan))
+    all_issues.extend(check_comment_consistency(scan))
     all_issues.extend(check_comment_artifacts(unpacked_dir))
     all_issues.extend(check_duplicate_entries(unpacked_dir))
-    all_issues.extend(check_xml_space(unpacked_dir))
+    all_issues.extend(check_xml_space(scan))
 
     if all_issues:
         result = {
@@ -12,9 +12,11 @@ sentences/sections exceeding thresholds.
 """
 
 import argparse
+import functools
 import json
 import re
 import sys
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 
 try:
@@ -37,7 +39,7 @@ except ImportError:
 # ---------------------------------------------------------------------------
 
 # Abbreviations that end with a period but don't end a sentence
-_ABBREVIATIONS = {
+_ABBREVIATIONS = frozenset({
     "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "ave", "blvd",
     "inc", "ltd", "corp", "co", "dept", "div", "est", "govt",
     "hon", "gen", "sgt", "cpl", "pvt", "capt", "maj", "col", "lt",
@@ -55,91 +57,111 @@ _ABBREVIATIONS = {
     "app", "civ", "crim", "ev", "ct", "const", "art", "sec",
     "supp", "dist", "cir", "cl", "op",
     "id", "cf",
-}
+})
 
 # Precompile a set of lowercase abbreviations without trailing periods
-_ABBREV_SET = set()
-for a in _ABBREVIATIONS:
-    _ABBREV_SET.add(a.replace(".", "").lower())
-    _ABBREV_SET.add(a.lower())
+_ABBREV_SET = frozenset(
+    form
+    for a in _ABBREVIATIONS
+    for form in (a.replace(".", "").lower(), a.lower())
+)
+
+# Footnote markers like "[*]" or "[**3]"
+_FOOTNOTE_RE = re.compile(r'\[\*+\d*\]')
 
+# Candidate sentence end: . ? or ! (optionally followed by a closing quote or
+# parenthesis) ending a word; group 1 is the first character of the next word
+# after any opening quotes or brackets.
+_SENT_END_RE = re.compile(r'[.?!]["\')]?(?=\s+["\'(\[]*(\S))')
 
+
+@functools.lru_cache(maxsize=4096)
 def _is_abbreviation(word: str) -> bool:
     """Check if a word (without trailing period) is a known abbreviation."""
     clean = word.rstrip(".").lower()
     return clean in _ABBREV_SET
 
 
-def split_sentences(text: str) -> list[str]:
-    """Split text into sentences, handling legal abbreviations and citations."""
-    # Remove footnote markers and paragraph markers
-    text = re.sub(r'\[\*+\d*\]', '', text)
+def _split_sentence_offsets(text: str) -> list[tuple[str, int, int]]:
+    """Split text into (sentence, start offset, word count) tuples.
+
+    Offsets index into ``text`` as given, before footnote markers are removed.
+    """
+    # Remove footnote markers, remembering how many characters were cut
+    # before each point so offsets can be mapped back to the original text
+    pieces = []
+    cut_at = [-1]   # position in the stripped text
+    cut_total = [0]  # characters removed up to that position
+    prev = 0
+    for m in _FOOTNOTE_RE.finditer(text):
+        pieces.append(text[prev:m.start()])
+        prev = m.end()
+        cut_total.append(cut_total[-1] + m.end() - m.start())
+        cut_at.append(m.end() - cut_total[-1])
+    if pieces:
+        pieces.append(text[prev:])
+        text = ''.join(pieces)
 
     # Split on sentence-ending punctuation followed by space + capital letter
     # or end of string, but be careful with abbreviations
-    sentences = []
-    current = []
-    words = text.split()
+    spans = []
+    start = 0
+
+    for m in _SENT_END_RE.finditer(text):
+        # Next word must start with a capital letter (new sentence)
+        if not m.group(1).isupper():
+            continue
+
+        end = m.end()
+        if m.group(0) == '.':
+            word = text[start:end].rsplit(None, 1)[-1]
+            if word.endswith('..'):
+                continue
+            # Check for abbreviation
+            if _is_abbreviation(word.rstrip('."\')')):
+                continue
 
-    for i, word in enumerate(words):
-        current.append(word)
+        spans.append((start, end))
+        start = end
 
-        # Check if this word ends a sentence
-        if not word:
+    # End of text is end of sentence
+    spans.append((start, len(text)))
+
+    sentences = []
+    for start, end in spans:
+        chunk = text[start:end]
+        words = chunk.split()
+        if not words:
             continue
+        offset = start + len(chunk) - len(chunk.lstrip())
+        offset += cut_total[bisect_right(cut_at, offset) - 1]
+        sentences.append((' '.join(words), offset, len(words)))
+
+    return sentences
 
-        ends_with_period = word.endswith('.') and not word.endswith('..')
-        ends_with_terminal = word.endswith(('?', '!'))
-        ends_with_quote_terminal = word.endswith(('."', '?"', '!"',
-                                                   ".'", "?'", "!'",
-                                                   '.)', '?)', '!)'))
-
-        if ends_with_terminal or ends_with_quote_terminal or ends_with_period:
-            # Check if next word starts with a capital letter (new sentence)
-            if i + 1 < len(words):
-                next_word = words[i + 1]
-                # Strip leading punctuation like quotes or parentheses
-                next_clean = next_word.lstrip('"\'(["')
-                next_starts_upper = next_clean and next_clean[0].isupper()
-
-                if ends_with_terminal or ends_with_quote_terminal:
-                    if next_starts_upper:
-                        sentences.append(' '.join(current))
-                        current = []
-                elif ends_with_period:
-                    # Check for abbreviation
-                    bare_word = word.rstrip('."\')')
-                    if not _is_abbreviation(bare_word) and next_starts_upper:
-                        # Also skip if the word looks like a citation reporter
-                        # (e.g., "2d", "3d", "4th" preceded by a number)
-                        if not re.match(r'^\d', next_clean):
-                            sentences.append(' '.join(current))
-                            current = []
-            elif i + 1 == len(words):
-                # Last word — end of text is end of sentence
-                sentences.append(' '.join(current))
-                current = []
-
-    if current:
-        sentences.append(' '.join(current))
-
-    # Filter out very short fragments (< 3 words) that are likely headings
-    # or citation-only lines, unless they're the only content
-    if len(sentences) > 1:
-        sentences = [s for s in sentences if len(s.split()) >= 3 or s.strip()]
-
-    return [s.strip() for s in sentences if s.strip()]
+
+def split_sentences(text: str) -> list[str]:
+    """Split text into sentences, handling legal abbreviations and citations."""
+    return [sentence for sentence, _, _ in _split_sentence_offsets(text)]
 
 
 # ---------------------------------------------------------------------------
 # Passive voice detection
 # ---------------------------------------------------------------------------
 
-_BE_FORMS = {'am', 'is', 'are', 'was', 'were', 'be', 'been', 'being'}
+_BE_FORMS = frozenset({
+    'am', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+})
+
+# A whole word that is a be-form (in any ASCII case) once trailing
+# punctuation is stripped
+_BE_RE = re.compile(
+    r'(?<!\S)(?ai:%s)[.,;:!?"\')\]]*(?!\S)' % '|'.join(sorted(_BE_FORMS))
+)
 
 # Common past participles (irregular verbs) — not exhaustive but covers
 # the most common ones in legal writing
-_IRREGULAR_PP = {
+_IRREGULAR_PP = frozenset({
     'been', 'born', 'borne', 'bound', 'brought', 'built', 'caught',
     'chosen', 'come', 'done', 'drawn', 'driven', 'eaten', 'fallen',
     'felt', 'found', 'given', 'gone', 'grown', 'heard', 'held',
@@ -148,19 +170,20 @@ _IRREGULAR_PP = {
     'seen', 'sent', 'set', 'shown', 'shut', 'sought', 'sold', 'spent',
     'spoken', 'stood', 'struck', 'taken', 'taught', 'thought', 'told',
     'understood', 'won', 'worn', 'written',
-}
+})
 
 # Regex for regular past participles: words ending in -ed (but not common
 # adjectives that aren't really passive)
-_NOT_PASSIVE = {
+_NOT_PASSIVE = frozenset({
     'alleged', 'concerned', 'supposed', 'required', 'needed', 'united',
     'continued', 'undisputed', 'above-referenced',
-}
+})
 
 
+@functools.lru_cache(maxsize=4096)
 def _is_past_participle(word: str) -> bool:
-    """Heuristic: is this word likely a past participle?"""
-    w = word.lower().rstrip('.,;:!?"\')]')
+    """Heuristic: is this (lowercase) word likely a past participle?"""
+    w = word.rstrip('.,;:!?"\')]')
     if w in _IRREGULAR_PP:
         return True
     if w in _NOT_PASSIVE:
@@ -178,22 +201,21 @@ def count_passive(sentences: list[str]) -> tuple[int, int]:
     passive_count = 0
 
     for sentence in sentences:
-        words = sentence.lower().split()
-        for i, word in enumerate(words):
-            clean = word.rstrip('.,;:!?"\')]')
-            if clean in _BE_FORMS and i + 1 < len(words):
-                # Check if next word (or word after adverb) is past participle
-                for offset in (1, 2):
-                    if i + offset < len(words):
-                        next_w = words[i + offset]
-                        if _is_past_participle(next_w):
-                            passive_count += 1
-                            break
-                        # Allow one adverb between be-verb and participle
-                        if offset == 1 and next_w.endswith('ly'):
-                            continue
-                        break
-                break  # Only check first be-verb per sentence
+        # Only check first be-verb per sentence
+        m = _BE_RE.search(sentence)
+        if not m:
+            continue
+        following = sentence[m.end():].split(None, 2)
+        if not following:
+            continue
+        # Check if next word (or word after adverb) is past participle
+        next_w = following[0].lower()
+        if _is_past_participle(next_w):
+            passive_count += 1
+        # Allow one adverb between be-verb and participle
+        elif (next_w.endswith('ly') and len(following) > 1
+                and _is_past_participle(following[1].lower())):
+            passive_count += 1
 
     return passive_count, len(sentences)
 
@@ -206,7 +228,7 @@ _NOM_SUFFIXES = ('tion', 'sion', 'ment', 'ness', 'ity', 'ence', 'ance')
 
 # Common words with these suffixes that aren't really nominalizations
 # (they're the primary/natural form, not derived from a verb)
-_NOM_EXCLUSIONS = {
+_NOM_EXCLUSIONS = frozenset({
     'court', 'constitution', 'portion', 'position', 'condition', 'mention',
     'attention', 'question', 'section', 'station', 'nation', 'caution',
     'function', 'action', 'election', 'fashion', 'opinion', 'occasion',
@@ -243,7 +265,9 @@ _NOM_EXCLUSIONS = {
     'avoidance', 'balance', 'brilliance', 'clearance', 'dance',
     'defiance', 'dominance', 'endurance', 'fragrance', 'governance',
     'guidance', 'hindrance', 'impedance',
-}
+})
+
+_WORD_RE = re.compile(r"[a-zA-Z]+(?:'[a-zA-Z]+)?")
 
 
 def count_nominalizations(text: str) -> tuple[int, int]:
@@ -251,7 +275,7 @@ def count_nominalizations(text: str) -> tuple[int, int]:
 
     Returns (nominalization_count, word_count).
     """
-    words = re.findall(r"[a-zA-Z]+(?:'[a-zA-Z]+)?", text)
+    words = _WORD_RE.findall(text)
     word_count = len(words)
     nom_count = 0
 
@@ -261,7 +285,7 @@ def count_nominalizations(text: str) -> tuple[int, int]:
             continue
         if w in _NOM_EXCLUSIONS:
             continue
-        if any(w.endswith(suffix) for suffix in _NOM_SUFFIXES):
+        if w.endswith(_NOM_SUFFIXES):
             nom_count += 1
 
     return nom_count, word_count
@@ -271,7 +295,7 @@ def count_nominalizations(text: str) -> tuple[int, int]:
 # Section detection
 # ---------------------------------------------------------------------------
 
-_KNOWN_HEADINGS = {
+_KNOWN_HEADINGS = frozenset({
     'FACTS', 'BACKGROUND', 'FACTUAL BACKGROUND', 'PROCEDURAL BACKGROUND',
     'FACTUAL AND PROCEDURAL BACKGROUND', 'PROCEDURAL HISTORY',
     'STANDARD OF REVIEW', 'STANDARDS OF REVIEW',
@@ -282,85 +306,102 @@ _KNOWN_HEADINGS = {
     'SUMMARY', 'INTRODUCTION', 'OVERVIEW',
     'ARGUMENT', 'ARGUMENTS',
     'CONCURRENCE', 'DISSENT', 'DISSENTING OPINION', 'CONCURRING OPINION',
-}
-
-_ROMAN_PATTERN = re.compile(
-    r'^(?:(?:IX|IV|V?I{0,3})\.|[A-Z]\.)(?:\s|$)', re.MULTILINE
+})
+
+# Heading lines. Each pattern starts at the newline before the line, which
+# lets the regex engine jump from line to line instead of trying every
+# character; callers scan '\n' + text so the first line is included.
+_HSPACE = r'[^\S\n]'
+_LINE_END = _HSPACE + r'*(?=\n|\Z)'
+
+_HEADING_RE = re.compile(
+    r'\n' + _HSPACE + r'*(?:'
+    # Known heading names in any case, optional trailing colon
+    r'(?ai:' + '|'.join(
+        re.escape(h) for h in sorted(_KNOWN_HEADINGS, key=len, reverse=True)
+    ) + r')' + _HSPACE + r'*:*'
+    # ALL CAPS line (at least 3 chars, at most 8 words)
+    r'|(?=\S[^\n]+\S)[A-Z][A-Z,&\-]*(?:' + _HSPACE + r'+[A-Z,&\-]+){0,7}'
+    # Roman numeral or letter heading: "I.", "II.", "A." (at most 10 words)
+    r'|(?:(?:IX|IV|V?I{0,3})\.|[A-Z]\.)(?:' + _HSPACE + r'+\S+){0,9}'
+    # Line ending with colon; the caller checks it follows a blank line and
+    # has at most 8 words
+    r'|(?P<colon>[^\n]*:)'
+    r')' + _LINE_END
 )
 
+# Paragraph marker at the start of a line: "¶ 12" or "[¶12]"
+_PARA_LINE_RE = re.compile(r'\n\[?¶' + _HSPACE + r'*(\d+)')
 
-def detect_sections(text: str) -> list[dict]:
-    """Detect document sections and their paragraph ranges.
+# Paragraph marker anywhere in the text
+_PARA_RE = re.compile(r'\[?[¶\u00b6]\s*(\d+)\]?')
 
-    Returns a list of dicts: {name, start_line, text, para_start, para_end}
-    """
-    lines = text.split('\n')
 
-    # First, find all paragraph markers to build a line->para map
-    para_map = {}  # line_index -> para_number
-    current_para = None
-    for i, line in enumerate(lines):
-        m = re.match(r'\[?\u00b6\s*(\d+)\]?', line)
-        if not m:
-            m = re.match(r'\[¶\s*(\d+)\]', line)
-        if m:
-            current_para = int(m.group(1))
-        if current_para is not None:
-            para_map[i] = current_para
+def _line_matches(scan: str, pattern: re.Pattern):
+    """Yield (line_index, match) for a newline-anchored pattern over scan."""
+    line = -1
+    pos = 0
+    for m in pattern.finditer(scan):
+        line += scan.count('\n', pos, m.start() + 1)
+        pos = m.start() + 1
+        yield line, m
 
-    # Find section boundaries
-    section_starts = []  # (line_index, name)
-
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if not stripped:
-            continue
 
-        # Check for known heading names (ALL CAPS or title case)
-        upper = stripped.upper().rstrip(':').strip()
-        if upper in _KNOWN_HEADINGS:
-            section_starts.append((i, stripped.rstrip(':')))
-            continue
+def detect_sections(text: str) -> list[dict]:
+    """Detect document sections and their paragraph ranges.
 
-        # ALL CAPS line (at least 3 chars, not a citation or paragraph marker)
-        if (len(stripped) >= 3
-                and stripped == stripped.upper()
-                and re.match(r'^[A-Z][A-Z\s,&\-]+$', stripped)
-                and not stripped.startswith('[')
-                and len(stripped.split()) <= 8):
-            section_starts.append((i, stripped.rstrip(':')))
-            continue
+    Returns a list of dicts:
+    {name, start_line, start_offset, text, para_start, para_end}
+    """
+    scan = '\n' + text
 
-        # Roman numeral or letter heading: "I.", "II.", "A."
-        if _ROMAN_PATTERN.match(stripped) and len(stripped.split()) <= 10:
-            section_starts.append((i, stripped.rstrip(':')))
-            continue
+    # First, find all paragraph markers to build a line->para index
+    marker_lines = []
+    marker_paras = []
+    for i, m in _line_matches(scan, _PARA_LINE_RE):
+        marker_lines.append(i)
+        marker_paras.append(int(m.group(1)))
 
-        # Line ending with colon preceded by blank line
-        if (stripped.endswith(':')
-                and i > 0
-                and not lines[i - 1].strip()
-                and len(stripped.split()) <= 8):
-            section_starts.append((i, stripped.rstrip(':')))
-            continue
+    # Find section boundaries
+    section_starts = []  # (line_index, char_offset, name)
+
+    for i, m in _line_matches(scan, _HEADING_RE):
+        # The match spans the whole line, from the newline before it
+        stripped = m.group().strip()
+        start = m.start()
+        if m.group('colon') is not None:
+            if i == 0:
+                continue
+            prev_start = text.rfind('\n', 0, start - 1) + 1
+            if (text[prev_start:start - 1].strip()
+                    or len(stripped.split()) > 8):
+                continue
+        section_starts.append((i, start, stripped.rstrip(':')))
 
     # Build sections
     sections = []
-    for idx, (start_line, name) in enumerate(section_starts):
-        end_line = (section_starts[idx + 1][0]
-                    if idx + 1 < len(section_starts) else len(lines))
-        section_text = '\n'.join(lines[start_line:end_line])
-
-        # Determine paragraph range
-        paras_in_section = [
-            para_map[j] for j in range(start_line, end_line) if j in para_map
-        ]
+    for idx, (start_line, start_offset, name) in enumerate(section_starts):
+        if idx + 1 < len(section_starts):
+            end_line, end_offset = section_starts[idx + 1][:2]
+            end_offset -= 1  # drop the newline before the next heading
+        else:
+            end_line, end_offset = text.count('\n') + 1, len(text)
+        section_text = text[start_offset:end_offset]
+
+        # Determine paragraph range: the paragraph open at the heading plus
+        # any that start inside the section
+        first = bisect_right(marker_lines, start_line)
+        last = bisect_left(marker_lines, end_line)
+        paras_in_section = marker_paras[first:last]
+        if first:
+            paras_in_section.append(marker_paras[first - 1])
         para_start = min(paras_in_section) if paras_in_section else None
         para_end = max(paras_in_section) if paras_in_section else None
 
         sections.append({
             'name': name,
             'start_line': start_line,
+            'start_offset': start_offset,
             'text': section_text,
             'para_start': para_start,
             'para_end': para_end,
@@ -368,13 +409,13 @@ def detect_sections(text: str) -> list[dict]:
 
     # If no sections detected, treat entire document as one section
     if not sections:
-        all_paras = list(para_map.values())
         sections = [{
             'name': 'Full Document',
             'start_line': 0,
+            'start_offset': 0,
             'text': text,
-            'para_start': min(all_paras) if all_paras else None,
-            'para_end': max(all_paras) if all_paras else None,
+            'para_start': min(marker_paras) if marker_paras else None,
+            'para_end': max(marker_paras) if marker_paras else None,
         }]
 
     return sections
@@ -384,9 +425,45 @@ def detect_sections(text: str) -> list[dict]:
 # Per-section analysis
 # ---------------------------------------------------------------------------
 
-def analyze_section(name: str, text: str, para_range: tuple) -> dict:
-    """Analyze a single section and return metrics."""
-    sentences = split_sentences(text)
+def _text_counts(text: str) -> dict:
+    """Split a block of text once and collect the raw counts that both the
+    per-section and overall metrics are built from."""
+    split = _split_sentence_offsets(text)
+    sentences = [sentence for sentence, _, _ in split]
+    passive_count, _ = count_passive(sentences)
+    nom_count, nom_words = count_nominalizations(text)
+    return {
+        'sentences': sentences,
+        'sentence_lengths': [length for _, _, length in split],
+        'passive_count': passive_count,
+        'nom_count': nom_count,
+        'nom_words': nom_words,
+        # Flesch-Kincaid inputs. Only syllables add up across chunks; word
+        # and sentence counts are taken from the full text for the overall
+        # grade, since textstat drops short fragments per call
+        'fk_words': textstat.lexicon_count(text),
+        'fk_sentences': textstat.sentence_count(text),
+        'fk_syllables': textstat.syllable_count(text),
+    }
+
+
+def _fk_grade(words: int, sentences: int, syllables: int) -> float:
+    """Flesch-Kincaid grade from textstat word, sentence and syllable counts,
+    evaluated the same way as textstat.flesch_kincaid_grade."""
+    if not words or not sentences or not syllables:
+        return 0.0
+    return (0.39 * (words / sentences)) + (11.8 * (syllables / words)) - 15.59
+
+
+def analyze_section(name: str, text: str, para_range: tuple,
+                    counts: dict | None = None) -> dict:
+    """Analyze a single section and return metrics.
+
+    ``counts`` may carry a precomputed ``_text_counts(text)`` result.
+    """
+    if counts is None:
+        counts = _text_counts(text)
+    sentences = counts['sentences']
     if not sentences:
         return {
             'name': name,
@@ -400,20 +477,21 @@ def analyze_section(name: str, text: str, para_range: tuple) -> dict:
         }
 
     # Word count and sentence lengths
-    sentence_lengths = [len(s.split()) for s in sentences]
+    sentence_lengths = counts['sentence_lengths']
     word_count = sum(sentence_lengths)
     avg_sentence_length = round(word_count / len(sentences), 1) if sentences else 0
     longest_sentence = max(sentence_lengths) if sentence_lengths else 0
 
     # Flesch-Kincaid
-    fk_grade = round(textstat.flesch_kincaid_grade(text), 1)
+    fk_grade = round(_fk_grade(counts['fk_words'], counts['fk_sentences'],
+                               counts['fk_syllables']), 1)
 
     # Passive voice
-    passive_count, total_sents = count_passive(sentences)
-    passive_pct = round(100 * passive_count / total_sents, 1) if total_sents else 0
+    passive_count = counts['passive_count']
+    passive_pct = round(100 * passive_count / len(sentences), 1)
 
     # Nominalizations
-    nom_count, wc = count_nominalizations(text)
+    nom_count, wc = counts['nom_count'], counts['nom_words']
     nom_density = round(100 * nom_count / wc, 1) if wc else 0
 
     return {
@@ -442,33 +520,53 @@ def _format_range(para_range: tuple) -> str:
 # Document-level analysis
 # ---------------------------------------------------------------------------
 
-def _find_para_for_line(text: str, char_offset: int) -> int | None:
-    """Find the paragraph number for a character offset in the text."""
-    prefix = text[:char_offset]
-    # Find the last paragraph marker before this offset
-    matches = list(re.finditer(r'\[?[¶\u00b6]\s*(\d+)\]?', prefix))
-    if matches:
-        return int(matches[-1].group(1))
+def _find_para_for_offset(marker_offsets: list[int], marker_paras: list[int],
+                          char_offset: int) -> int | None:
+    """Find the paragraph number for a character offset in the text.
+
+    ``marker_offsets`` holds the sorted start offsets of every paragraph
+    marker in the text and ``marker_paras`` their paragraph numbers.
+    """
+    # Find the last paragraph marker at or before this offset
+    idx = bisect_right(marker_offsets, char_offset)
+    if idx:
+        return marker_paras[idx - 1]
     return None
 
 
 def analyze_document(text: str) -> dict:
     """Analyze the full document and return metrics + flags."""
     sections = detect_sections(text)
-
-    # Overall metrics
-    all_sentences = split_sentences(text)
-    all_lengths = [len(s.split()) for s in all_sentences]
-    total_words = sum(all_lengths)
+    section_counts = [_text_counts(sec['text']) for sec in sections]
+
+    # Sentence figures come from one split of the full text: splitting each
+    # section separately would turn heading and caption lines into fragment
+    # "sentences" of their own
+    all_split = _split_sentence_offsets(text)
+    all_sentences = [sentence for sentence, _, _ in all_split]
+    total_words = sum(length for _, _, length in all_split)
     total_sents = len(all_sentences)
 
-    overall_fk = round(textstat.flesch_kincaid_grade(text), 1)
+    # Nominalizations and syllables add up exactly over chunks split at line
+    # boundaries, so they are summed from the sections plus any text before
+    # the first heading instead of being counted again
+    chunk_counts = list(section_counts)
+    first_offset = sections[0]['start_offset']
+    if first_offset:
+        chunk_counts.insert(0, _text_counts(text[:first_offset - 1]))
+
+    overall_fk = round(_fk_grade(
+        textstat.lexicon_count(text),
+        textstat.sentence_count(text),
+        sum(c['fk_syllables'] for c in chunk_counts),
+    ), 1)
     avg_sent_len = round(total_words / total_sents, 1) if total_sents else 0
 
     passive_count, _ = count_passive(all_sentences)
     passive_pct = round(100 * passive_count / total_sents, 1) if total_sents else 0
 
-    nom_count, wc = count_nominalizations(text)
+    nom_count = sum(c['nom_count'] for c in chunk_counts)
+    wc = sum(c['nom_words'] for c in chunk_counts)
     nom_density = round(100 * nom_count / wc, 1) if wc else 0
 
     overall = {
@@ -482,28 +580,32 @@ def analyze_document(text: str) -> dict:
 
     # Per-section metrics
     section_results = []
-    for sec in sections:
+    for sec, counts in zip(sections, section_counts):
         para_range = (sec['para_start'], sec['para_end'])
-        result = analyze_section(sec['name'], sec['text'], para_range)
+        result = analyze_section(sec['name'], sec['text'], para_range, counts)
         section_results.append(result)
 
     # Generate flags
     flags = []
 
     # Flag long sentences (> 40 words)
-    for sentence in all_sentences:
-        words = sentence.split()
-        if len(words) > 40:
-            # Find paragraph number
-            idx = text.find(sentence[:50])
-            para = _find_para_for_line(text, idx) if idx >= 0 else None
-            preview = ' '.join(words[:10]) + '...'
-            flags.append({
-                'para': para,
-                'type': 'long_sentence',
-                'value': len(words),
-                'text': preview,
-            })
+    marker_offsets = []
+    marker_paras = []
+    for m in _PARA_RE.finditer(text):
+        marker_offsets.append(m.start())
+        marker_paras.append(int(m.group(1)))
+    for sentence, offset, length in all_split:
+        if length <= 40:
+            continue
+        # Find paragraph number
+        para = _find_para_for_offset(marker_offsets, marker_paras, offset)
+        preview = ' '.join(sentence.split(None, 10)[:10]) + '...'
+        flags.append({
+            'para': para,
+            'type': 'long_sentence',
+            'value': length,
+            'text': preview,
+        })
 
     # Flag high passive and high FK grade per section
     for sec_result in section_results:
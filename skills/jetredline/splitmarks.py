@@ -3,17 +3,31 @@
 splitmarks - Split PDF files at top-level bookmarks into separate files.
 """
 
+from __future__ import annotations
+
 import argparse
+import concurrent.futures
+import functools
+import os
 import re
 import sys
-import unicodedata
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pikepdf
+# pikepdf is a large C++ extension; import it only where PDFs are touched so
+# --help, --version and argument errors don't pay its load time.
+if TYPE_CHECKING:
+    import pikepdf
 
 __version__ = "1.4.0"
 
+# 8-digit case number not embedded in a longer run of digits
+_CASE_RE = re.compile(r"(?<!\d)(\d{8})(?!\d)")
+# Runs of whitespace, underscores, hyphens and unsafe filesystem characters,
+# each run collapsed to a single hyphen
+_SEPARATOR_RE = re.compile(r'[\s_\-/\\:*?"<>|]+')
+
 
 @dataclass
 class Bookmark:
@@ -26,15 +40,11 @@ class Bookmark:
 
 def extract_case_number(text: str) -> str | None:
     """Extract an 8-digit case number from text."""
-    match = re.search(r"(?<!\d)(\d{8})(?!\d)", text)
+    match = _CASE_RE.search(text)
     return match.group(1) if match else None
 
 
-def contains_case_number(text: str) -> bool:
-    """Check if text contains an 8-digit number."""
-    return bool(re.search(r"(?<!\d)\d{8}(?!\d)", text))
-
-
+@functools.lru_cache(maxsize=2048)
 def sanitize_filename(title: str, max_length: int = 200) -> str:
     """
     Sanitize a bookmark title for use as a filename.
@@ -43,55 +53,79 @@ def sanitize_filename(title: str, max_length: int = 200) -> str:
     - Normalizes unicode
     - Collapses whitespace to hyphens
     - Truncates at word boundary
+
+    Results are cached per (title, max_length); repeated titles return the
+    same (immutable) string without redoing the work.
     """
-    # Normalize unicode to composed form
-    title = unicodedata.normalize("NFC", title)
+    # Normalize unicode to composed form (ASCII is already normalized)
+    if not title.isascii():
+        import unicodedata
 
-    # Replace unsafe filesystem characters with hyphens
-    unsafe_chars = r'/\:*?"<>|'
-    for char in unsafe_chars:
-        title = title.replace(char, "-")
+        title = unicodedata.normalize("NFC", title)
 
-    # Collapse multiple whitespace/underscores/hyphens into single hyphen
-    title = re.sub(r"[\s_-]+", "-", title)
-    title = title.strip("-")
+    # Replace unsafe characters and collapse whitespace/underscores/hyphens
+    # into a single hyphen in one pass
+    title = _SEPARATOR_RE.sub("-", title).strip("-")
 
     # Truncate at word boundary if too long
     if len(title) > max_length:
-        truncated = title[:max_length]
-        # Find last hyphen to avoid cutting words
-        last_hyphen = truncated.rfind("-")
+        # Find last hyphen within the limit to avoid cutting words
+        last_hyphen = title.rfind("-", 0, max_length)
         if last_hyphen > max_length // 2:
-            title = truncated[:last_hyphen]
+            title = title[:last_hyphen]
         else:
-            title = truncated
+            title = title[:max_length]
 
     return title.strip("-") or "untitled"
 
 
-def get_unique_filename(output_dir: Path, base_name: str, used_names: set) -> Path:
+def get_unique_filename(
+    output_dir: Path,
+    base_name: str,
+    used_names: set,
+    base_counter: dict[str, int] | None = None,
+) -> Path:
     """
     Generate a unique filename, adding counter for duplicates.
 
+    If base_counter is given, it records the next counter to try for each
+    base name, so repeated collisions resume where the last search stopped
+    instead of re-probing from zero.
+
     Returns paths like: title.pdf, title-1.pdf, title-2.pdf
     """
-    candidate = base_name
-    counter = 0
+    key = base_name.lower()
+    counter = base_counter.get(key, 0) if base_counter is not None else 0
+    candidate = f"{base_name}-{counter}" if counter else base_name
 
     while candidate.lower() in used_names:
         counter += 1
         candidate = f"{base_name}-{counter}"
 
     used_names.add(candidate.lower())
+    if base_counter is not None:
+        base_counter[key] = counter + 1
     return output_dir / f"{candidate}.pdf"
 
 
-def _resolve_page_number(pdf: pikepdf.Pdf, outline_node) -> int | None:
+def _resolve_page_number(
+    pdf: pikepdf.Pdf,
+    outline_node,
+    page_index: dict[tuple[int, int], int],
+    dest_cache: dict[tuple[int, int], int | None],
+) -> int | None:
     """
     Resolve a bookmark's page number from either /Dest or /A (GoTo action).
 
+    page_index maps each page object's (objnum, gen) to its 0-based index,
+    so resolution is a dict lookup rather than a scan of pdf.pages.
+    Destinations missing from page_index are resolved the slow way once and
+    remembered in dest_cache, since several bookmarks often share a target.
+
     Returns 0-based page index, or None if unresolvable.
     """
+    import pikepdf
+
     # Try direct destination first
     dest = None
     if hasattr(outline_node, "destination") and outline_node.destination:
@@ -110,36 +144,87 @@ def _resolve_page_number(pdf: pikepdf.Pdf, outline_node) -> int | None:
 
     try:
         page_ref = dest[0]
-        return pdf.pages.index(page_ref)
-    except (IndexError, ValueError, TypeError):
+        key = page_ref.objgen
+    except (IndexError, ValueError, TypeError, AttributeError):
         return None
 
+    page_num = page_index.get(key)
+    if page_num is not None:
+        return page_num
+    # Direct (non-indirect) objects all report objgen (0, 0); don't cache them
+    if key != (0, 0) and key in dest_cache:
+        return dest_cache[key]
+    try:
+        page_num = pikepdf.Page(page_ref).index
+    except (IndexError, ValueError, TypeError, AttributeError):
+        page_num = None
+    if key != (0, 0):
+        dest_cache[key] = page_num
+    return page_num
+
+
+def _parse_outline_items(
+    pdf: pikepdf.Pdf,
+    items,
+    page_index: dict[tuple[int, int], int],
+    dest_cache: dict[tuple[int, int], int | None],
+    match_folded: str | None = None,
+) -> list[Bookmark]:
+    """
+    Parse outline items into Bookmark objects.
+
+    Walks the outline with an explicit stack so deeply nested outlines
+    cannot exhaust the interpreter's recursion limit. Items whose page
+    cannot be resolved are dropped along with their descendants.
 
-def _parse_outline_items(pdf: pikepdf.Pdf, items) -> list[Bookmark]:
-    """Recursively parse outline items into Bookmark objects."""
-    bookmarks = []
-    for item in items:
-        page_num = _resolve_page_number(pdf, item)
+    If match_folded is given, only the parts of the tree a --match split can
+    use are parsed: every top-level and second-level bookmark (needed for
+    page ranges), plus the full subtree below any of those whose casefolded
+    title contains match_folded. Other subtrees are left unparsed.
+    """
+    bookmarks: list[Bookmark] = []
+    # Entries are (item, parent's children list, depth, inside a matched
+    # subtree); siblings are pushed in reverse so each list fills in order
+    stack = [(item, bookmarks, 0, False) for item in reversed(list(items))]
+    while stack:
+        item, siblings, depth, matched = stack.pop()
+        page_num = _resolve_page_number(pdf, item, page_index, dest_cache)
         if page_num is None:
             continue
-        children = []
-        if item.children:
-            children = _parse_outline_items(pdf, item.children)
-        bookmarks.append(
-            Bookmark(title=str(item.title), page_num=page_num, children=children)
+        title = str(item.title)
+        bookmark = Bookmark(title=title, page_num=page_num)
+        siblings.append(bookmark)
+        if not item.children:
+            continue
+        if match_folded is not None and not matched:
+            matched = match_folded in title.casefold()
+            if not matched and depth >= 1:
+                continue
+        stack.extend(
+            (child, bookmark.children, depth + 1, matched)
+            for child in reversed(item.children)
         )
     return bookmarks
 
 
-def parse_outline_tree(pdf: pikepdf.Pdf) -> list[Bookmark]:
+def parse_outline_tree(pdf: pikepdf.Pdf, match: str | None = None) -> list[Bookmark]:
     """
     Parse the PDF outline into a tree of Bookmark objects.
 
+    If match is given, subtrees that cannot contribute to a --match split
+    are skipped (see _parse_outline_items).
+
     Returns list of top-level Bookmark objects, each with nested children.
     """
+    # Map page objects to indices once; pdf.pages.index() is a linear scan
+    page_index = {page.objgen: i for i, page in enumerate(pdf.pages)}
+    dest_cache: dict[tuple[int, int], int | None] = {}
+    match_folded = match.casefold() if match else None
     try:
         with pdf.open_outline() as outline:
-            return _parse_outline_items(pdf, outline.root)
+            return _parse_outline_items(
+                pdf, outline.root, page_index, dest_cache, match_folded
+            )
     except Exception:
         return []
 
@@ -155,63 +240,124 @@ def get_top_level_bookmarks(bookmarks: list[Bookmark]) -> list[tuple[str, int]]:
     return result
 
 
+def _find_bookmark(
+    bookmark_by_title: dict[str, list[Bookmark]], title: str, page_num: int
+) -> Bookmark | None:
+    """Return the top-level bookmark with this title starting at page_num."""
+    for bookmark in bookmark_by_title.get(title, ()):
+        if bookmark.page_num == page_num:
+            return bookmark
+    return None
+
+
 def print_bookmark_tree(bookmark: Bookmark, indent: int = 0) -> None:
     """Print a bookmark and its children with indentation."""
-    prefix = "  " * indent + ("- " if indent > 0 else "")
-    print(f"    {prefix}{bookmark.title}")
-    for child in bookmark.children:
-        print_bookmark_tree(child, indent + 1)
+    stack = [(bookmark, indent)]
+    while stack:
+        node, depth = stack.pop()
+        prefix = "  " * depth + ("- " if depth > 0 else "")
+        print(f"    {prefix}{node.title}")
+        stack.extend((child, depth + 1) for child in reversed(node.children))
 
 
-def add_bookmarks_to_writer(
-    pdf: pikepdf.Pdf,
+def _add_bookmark_subtree(
+    outline_parent: list,
     bookmark: Bookmark,
     start_page: int,
     end_page: int,
-    parent=None,
 ) -> None:
     """
-    Recursively add a bookmark and its children to the output PDF.
+    Add a bookmark and its children under an already-open output outline.
 
-    Only includes bookmarks whose pages fall within the given range.
+    outline_parent is the list to append to (outline.root or an
+    OutlineItem's children). Only includes bookmarks whose pages fall
+    within the given range; an out-of-range bookmark drops its subtree.
     Page numbers are adjusted relative to start_page.
     """
-    if start_page <= bookmark.page_num <= end_page:
-        adjusted_page = bookmark.page_num - start_page
+    import pikepdf
 
-        with pdf.open_outline() as outline:
-            target = parent if parent is not None else outline.root
-            item = pikepdf.OutlineItem(
-                bookmark.title, adjusted_page
-            )
-            target.append(item)
-
-            for child in bookmark.children:
-                if start_page <= child.page_num <= end_page:
-                    child_adjusted = child.page_num - start_page
-                    child_item = pikepdf.OutlineItem(
-                        child.title, child_adjusted
-                    )
-                    item.children.append(child_item)
-                    # Recurse for deeper nesting
-                    _add_children_recursive(
-                        child.children, child_item, start_page, end_page
-                    )
-
-
-def _add_children_recursive(
-    children: list[Bookmark],
-    parent_item: pikepdf.OutlineItem,
+    stack = [(bookmark, outline_parent)]
+    while stack:
+        node, parent = stack.pop()
+        if not start_page <= node.page_num <= end_page:
+            continue
+        item = pikepdf.OutlineItem(node.title, node.page_num - start_page)
+        parent.append(item)
+        stack.extend((child, item.children) for child in reversed(node.children))
+
+
+def _write_split(
+    pdf: pikepdf.Pdf,
+    output_path: Path,
     start_page: int,
     end_page: int,
+    promoted: list[Bookmark],
+    prune_resources: bool,
 ) -> None:
-    """Recursively add child bookmarks."""
-    for child in children:
-        if start_page <= child.page_num <= end_page:
-            adjusted = child.page_num - start_page
-            item = pikepdf.OutlineItem(child.title, adjusted)
-            parent_item.children.append(item)
-            _add_children_recursive(child.children, item, start_page, end_page)
+    """
+    Write pages start_page..end_page (inclusive) of pdf to output_path.
+
+    promoted bookmarks become the output's top-level outline entries.
+    """
+    import pikepdf
+
+    # Create new PDF with the page range
+    out_pdf = pikepdf.Pdf.new()
+    out_pdf.pages.extend(pdf.pages[start_page:end_page + 1])
+
+    # Remove resources not referenced by the included pages
+    if prune_resources:
+        out_pdf.remove_unreferenced_resources()
+
+    if promoted:
+        with out_pdf.open_outline() as outline:
+            for sub in promoted:
+                _add_bookmark_subtree(outline.root, sub, start_page, end_page)
+
+    # Copy content streams through as-is rather than decoding and
+    # recompressing every stream of every split
+    out_pdf.save(
+        output_path,
+        object_stream_mode=pikepdf.ObjectStreamMode.generate,
+        stream_decode_level=pikepdf.StreamDecodeLevel.none,
+    )
+
+
+def _write_split_from_file(
+    input_path: Path,
+    output_path: Path,
+    start_page: int,
+    end_page: int,
+    promoted: list[Bookmark],
+    prune_resources: bool,
+) -> None:
+    """
+    Worker-process entry point: reopen input_path and write one split.
+
+    Bookmarks are plain dataclasses, so they pickle without any pikepdf
+    objects crossing the process boundary.
+    """
+    import pikepdf
+
+    with pikepdf.Pdf.open(input_path) as pdf:
+        _write_split(
+            pdf, output_path, start_page, end_page, promoted, prune_resources
+        )
+
+
+def _run_write(output_path: Path, write) -> None:
+    """Run a split write, exiting with an error message if it fails."""
+    try:
+        write()
+    except PermissionError:
+        print(
+            f"Error: Permission denied writing to {output_path}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    except OSError as e:
+        print(f"Error: Failed to write {output_path}: {e}", file=sys.stderr)
+        sys.exit(1)
 
 
 def calculate_page_ranges(
@@ -223,21 +369,16 @@ def calculate_page_ranges(
     Returns list of (title, start_page, end_page) tuples.
     end_page is inclusive.
     """
-    ranges = []
-
-    for i, (title, start_page) in enumerate(bookmarks):
-        if i + 1 < len(bookmarks):
-            # End at page before next bookmark
-            end_page = bookmarks[i + 1][1] - 1
-        else:
-            # Last bookmark goes to end of document
-            end_page = total_pages - 1
-
-        # Ensure valid range
-        if end_page >= start_page:
-            ranges.append((title, start_page, end_page))
-
-    return ranges
+    # Each section ends at the page before the next bookmark; the last
+    # bookmark goes to the end of the document
+    end_pages = [next_start - 1 for _, next_start in bookmarks[1:]]
+    end_pages.append(total_pages - 1)
+
+    return [
+        (title, start_page, end_page)
+        for (title, start_page), end_page in zip(bookmarks, end_pages)
+        if end_page >= start_page
+    ]
 
 
 def calculate_child_page_ranges(
@@ -253,19 +394,14 @@ def calculate_child_page_ranges(
         return []
 
     children_sorted = sorted(parent.children, key=lambda b: b.page_num)
-    ranges = []
-
-    for i, child in enumerate(children_sorted):
-        start_page = child.page_num
-        if i + 1 < len(children_sorted):
-            end_page = children_sorted[i + 1].page_num - 1
-        else:
-            end_page = parent_end_page
+    end_pages = [child.page_num - 1 for child in children_sorted[1:]]
+    end_pages.append(parent_end_page)
 
-        if end_page >= start_page:
-            ranges.append((child.title, start_page, end_page, child))
-
-    return ranges
+    return [
+        (child.title, child.page_num, end_page, child)
+        for child, end_page in zip(children_sorted, end_pages)
+        if end_page >= child.page_num
+    ]
 
 
 def split_pdf(
@@ -275,6 +411,8 @@ def split_pdf(
     dry_run: bool = False,
     match: str | None = None,
     no_clobber: bool = False,
+    keep_resources: bool = False,
+    jobs: int = 1,
 ) -> int:
     """
     Split a PDF at top-level bookmarks into separate files.
@@ -285,9 +423,15 @@ def split_pdf(
         no_clobber: If True, prepend 8-digit case number to output files that don't
             already contain one. Uses number from input filename, or starts at 00000000
             and increments until finding an unused filename.
+        keep_resources: If True, never prune unreferenced page resources. Output
+            files may be larger but are still valid PDFs.
+        jobs: Number of worker processes used to write output files. Each worker
+            reopens the input; 1 writes everything in this process.
 
     Returns the number of files created (or would be created in dry-run mode).
     """
+    import pikepdf
+
     # Read the input PDF
     try:
         pdf = pikepdf.Pdf.open(input_path)
@@ -302,13 +446,19 @@ def split_pdf(
     if verbose >= 1:
         print(f"Opened {input_path.name} ({total_pages} pages)")
 
-    # Parse full bookmark tree
-    bookmark_tree = parse_outline_tree(pdf)
+    # Parse bookmark tree (only the parts --match can use, if given)
+    bookmark_tree = parse_outline_tree(pdf, match)
 
     if not bookmark_tree:
         print("Error: No top-level bookmarks found in PDF", file=sys.stderr)
         sys.exit(1)
 
+    # Map top-level titles to their Bookmark objects; titles can repeat, so
+    # each entry is disambiguated by start page via _find_bookmark()
+    bookmark_by_title: dict[str, list[Bookmark]] = {}
+    for b in bookmark_tree:
+        bookmark_by_title.setdefault(b.title, []).append(b)
+
     # Get top-level bookmarks for splitting
     top_level = get_top_level_bookmarks(bookmark_tree)
 
@@ -324,9 +474,15 @@ def split_pdf(
         (t, s, e, None) for t, s, e in ranges
     ]
     if match:
-        match_lower = match.lower()
+        # casefold() so matching also folds non-ASCII case (e.g. "ß" ~ "ss")
+        match_folded = match.casefold()
         # Try top-level first
-        filtered = [r for r in ranges_ext if match_lower in r[0].lower()]
+        range_titles_folded = [r[0].casefold() for r in ranges_ext]
+        filtered = [
+            r
+            for r, title_folded in zip(ranges_ext, range_titles_folded)
+            if match_folded in title_folded
+        ]
         if filtered:
             if verbose >= 1:
                 print(f"Filtered to {len(filtered)} top-level bookmark(s) matching '{match}'")
@@ -334,14 +490,13 @@ def split_pdf(
         else:
             # Fall back to second-level (child) bookmarks
             child_matches: list[tuple[str, int, int, Bookmark | None]] = []
-            bookmark_by_title_tmp = {b.title: b for b in bookmark_tree}
             for title, start_page, end_page in ranges:
-                parent_bm = bookmark_by_title_tmp.get(title)
+                parent_bm = _find_bookmark(bookmark_by_title, title, start_page)
                 if not parent_bm or not parent_bm.children:
                     continue
                 child_ranges = calculate_child_page_ranges(parent_bm, end_page)
                 for child_title, cs, ce, child_bm in child_ranges:
-                    if match_lower in child_title.lower():
+                    if match_folded in child_title.casefold():
                         if verbose >= 1:
                             print(f"Matched child bookmark '{child_title}' under '{title}'")
                         child_matches.append((child_title, cs, ce, child_bm))
@@ -367,35 +522,64 @@ def split_pdf(
             if verbose >= 1:
                 print("No case number in input filename, will auto-generate if needed")
 
+    # List existing output files once so auto-numbering probes a set, not disk
+    existing_names: set[str] = set()
+    if no_clobber and not base_case_number and output_dir.is_dir():
+        with os.scandir(output_dir) as entries:
+            existing_names = {
+                entry.name.lower()
+                for entry in entries
+                if entry.name.lower().endswith(".pdf")
+            }
+
     # Track used filenames to handle duplicates
     used_names: set[str] = set()
+    name_counters: dict[str, int] = {}
+    # Next auto-generated case number to try, per sanitized title
+    next_case_num: dict[str, int] = {}
     files_created = 0
-
-    # Create a mapping from top-level title to its Bookmark object
-    bookmark_by_title = {b.title: b for b in bookmark_tree}
+    # (output_path, start_page, end_page, promoted, prune_resources) per file,
+    # queued only when writing in worker processes
+    writes: list[tuple[Path, int, int, list[Bookmark], bool]] = []
 
     for title, start_page, end_page, child_bookmark in ranges_ext:
+        top_bookmark = (
+            None
+            if child_bookmark
+            else _find_bookmark(bookmark_by_title, title, start_page)
+        )
+
         # Generate safe filename
         safe_name = sanitize_filename(title)
 
         # Handle no-clobber: prepend case number if needed, check for existing files
-        if no_clobber and not contains_case_number(safe_name):
+        if no_clobber and _CASE_RE.search(safe_name) is None:
             if base_case_number:
                 # Use case number from input filename
                 candidate_name = f"{base_case_number}_{safe_name}"
-                output_path = get_unique_filename(output_dir, candidate_name, used_names)
+                output_path = get_unique_filename(
+                    output_dir, candidate_name, used_names, name_counters
+                )
             else:
-                # No case number in input, find an unused number
-                case_num = 0
+                # No case number in input, find an unused number, resuming
+                # after the last number handed out for this title
+                case_num = next_case_num.get(safe_name.lower(), 0)
                 while True:
                     candidate_name = f"{case_num:08d}_{safe_name}"
-                    output_path = output_dir / f"{candidate_name}.pdf"
-                    if not output_path.exists() and candidate_name.lower() not in used_names:
-                        used_names.add(candidate_name.lower())
+                    candidate_key = candidate_name.lower()
+                    if (
+                        f"{candidate_key}.pdf" not in existing_names
+                        and candidate_key not in used_names
+                    ):
+                        used_names.add(candidate_key)
+                        next_case_num[safe_name.lower()] = case_num + 1
+                        output_path = output_dir / f"{candidate_name}.pdf"
                         break
                     case_num += 1
         else:
-            output_path = get_unique_filename(output_dir, safe_name, used_names)
+            output_path = get_unique_filename(
+                output_dir, safe_name, used_names, name_counters
+            )
 
         page_count = end_page - start_page + 1
 
@@ -408,9 +592,9 @@ def split_pdf(
                     print("  Bookmarks:")
                     for sub in child_bookmark.children:
                         print_bookmark_tree(sub, indent=1)
-                elif title in bookmark_by_title:
+                elif top_bookmark:
                     print("  Bookmarks:")
-                    print_bookmark_tree(bookmark_by_title[title])
+                    print_bookmark_tree(top_bookmark)
         else:
             if verbose >= 1:
                 print(f"Creating: {output_path.name}")
@@ -420,50 +604,48 @@ def split_pdf(
                         print("  Bookmarks:")
                         for sub in child_bookmark.children:
                             print_bookmark_tree(sub, indent=1)
-                    elif title in bookmark_by_title:
+                    elif top_bookmark:
                         print("  Bookmarks:")
-                        print_bookmark_tree(bookmark_by_title[title])
-
-            # Create new PDF with the page range
-            out_pdf = pikepdf.Pdf.new()
-            for page_num in range(start_page, end_page + 1):
-                out_pdf.pages.append(pdf.pages[page_num])
-
-            # Remove resources not referenced by the included pages
-            out_pdf.remove_unreferenced_resources()
+                        print_bookmark_tree(top_bookmark)
 
             # Add bookmarks to output
             if child_bookmark:
                 # Child match: add the child's sub-children as top-level bookmarks
-                for sub in child_bookmark.children:
-                    add_bookmarks_to_writer(
-                        out_pdf, sub, start_page, end_page
-                    )
-            elif title in bookmark_by_title:
+                promoted = child_bookmark.children
+            elif top_bookmark:
                 # Top-level match: promote children to top level as before
-                top_bookmark = bookmark_by_title[title]
-                for child in top_bookmark.children:
-                    add_bookmarks_to_writer(
-                        out_pdf, child, start_page, end_page
-                    )
-
-            try:
-                out_pdf.save(
-                    output_path,
-                    object_stream_mode=pikepdf.ObjectStreamMode.generate,
-                )
-            except PermissionError:
-                print(
-                    f"Error: Permission denied writing to {output_path}",
-                    file=sys.stderr,
-                )
-                sys.exit(1)
-            except OSError as e:
-                print(f"Error: Failed to write {output_path}: {e}", file=sys.stderr)
-                sys.exit(1)
+                promoted = top_bookmark.children
+            else:
+                promoted = []
+
+            # Prune unreferenced resources unless the split is (nearly) the
+            # whole document, where walking the resource graph costs more
+            # than it saves
+            prune_resources = not keep_resources and page_count < total_pages * 0.9
+
+            write = (output_path, start_page, end_page, promoted, prune_resources)
+            if jobs > 1:
+                # Queue for the process pool below
+                writes.append(write)
+            else:
+                # Write straight away so the -v log never runs ahead of
+                # the files actually written
+                _run_write(output_path, functools.partial(_write_split, pdf, *write))
 
         files_created += 1
 
+    if jobs > 1 and len(writes) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(_write_split_from_file, input_path, *write)
+                for write in writes
+            ]
+            for write, future in zip(writes, futures):
+                _run_write(write[0], future.result)
+    else:
+        for write in writes:
+            _run_write(write[0], functools.partial(_write_split, pdf, *write))
+
     return files_created
 
 
@@ -513,6 +695,18 @@ def main() -> None:
         action="store_true",
         help="Avoid filename collisions by prepending case number from input filename, or auto-incrementing from 00000000",
     )
+    parser.add_argument(
+        "--keep-resources",
+        action="store_true",
+        help="Skip pruning unreferenced page resources (faster, larger files)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Write output files using N worker processes (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -525,6 +719,10 @@ def main() -> None:
         print(f"Error: Not a file: {args.input_pdf}", file=sys.stderr)
         sys.exit(1)
 
+    if args.jobs < 1:
+        print("Error: --jobs must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
     # Run the split
     count = split_pdf(
         input_path=args.input_pdf,
@@ -533,6 +731,8 @@ def main() -> None:
         dry_run=args.dry_run,
         match=args.match,
         no_clobber=args.no_clobber,
+        keep_resources=args.keep_resources,
+        jobs=args.jobs,
     )
 
     # Summary